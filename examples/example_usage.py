@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 # Import main functions
 from combiners import combine_json_files
 from converters import convert_json_to_csv_enhanced
+from pipeline import combine_to_csv
 
 # Import utilities
 from utils import (
@@ -135,31 +136,23 @@ def example_4_complete_workflow():
         validated_dir = validate_directory(input_dir)
         logger.info(f"✓ Input directory validated: {validated_dir}")
 
-        # Step 2: Combine JSON files
-        logger.info("Step 1/2: Combining JSON files...")
-        combine_result = combine_json_files(
+        # Step 2: Stream JSON files straight to CSV - no intermediate
+        # combined.json is written or re-read
+        logger.info("Converting JSON files directly to CSV...")
+        result = combine_to_csv(
             input_dir=input_dir,
-            output_file="combined.json",
+            output_csv=f"{output_dir}/companies.csv",
             pattern="*.json"
         )
-        logger.info(f"✓ Combined {combine_result['files_processed']} files")
-
-        # Step 3: Convert to CSV
-        logger.info("Step 2/2: Converting to CSV...")
-        convert_result = convert_json_to_csv_enhanced(
-            input_pattern="combined.json",
-            output_file=f"{output_dir}/companies.csv",
-            input_dir=input_dir
-        )
-        logger.info(f"✓ Created CSV with {convert_result['rows_written']} rows")
+        logger.info(f"✓ Created CSV with {result['rows_written']} rows")
 
         # Summary
         log_operation_summary(
             logger,
             operation="Complete Workflow",
             success=True,
-            files_processed=combine_result['files_processed'],
-            rows_written=convert_result['rows_written'],
+            files_processed=result['files_processed'],
+            rows_written=result['rows_written'],
         )
 
     except Exception as e:
@@ -33,6 +33,12 @@ setup(
     install_requires=[
         # No external dependencies - uses Python standard library only
     ],
+    extras_require={
+        # Optional accelerators, picked up automatically when importable;
+        # every module falls back to the stdlib without them
+        "fast": ["orjson"],
+        "full": ["orjson", "xxhash", "numba"],
+    },
     entry_points={
         "console_scripts": [
             "json-merger=src.combiners.json_merger:main",
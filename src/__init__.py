@@ -7,12 +7,34 @@ A collection of tools for data manipulation, conversion, and combination.
 __version__ = "0.2.0"
 __author__ = "rahalio"
 
-from .combiners.json_merger import combine_json_files
-from .converters.linkedin_to_csv import convert_json_to_csv
-from .converters.linkedin_to_csv_enhanced import convert_json_to_csv as convert_json_to_csv_enhanced
-
 __all__ = [
     "combine_json_files",
     "convert_json_to_csv",
     "convert_json_to_csv_enhanced",
+    "combine_to_csv",
 ]
+
+# Lazy attribute table (PEP 562): name -> (submodule, attribute). CLI
+# entry points import this package for a single tool; deferring the
+# submodule imports keeps their cold start from paying for the
+# combiners, converters and utils they never touch.
+_LAZY_ATTRS = {
+    "combine_json_files": ("combiners.json_merger", "combine_json_files"),
+    "convert_json_to_csv": ("converters.linkedin_to_csv", "convert_json_to_csv"),
+    "convert_json_to_csv_enhanced": ("converters.linkedin_to_csv_enhanced", "convert_json_to_csv"),
+    "combine_to_csv": ("pipeline", "combine_to_csv"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), attr)
+    # Cache so subsequent lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
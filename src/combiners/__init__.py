@@ -4,6 +4,6 @@ Combiners Module
 Tools for combining multiple data files into single files.
 """
 
-from .json_merger import combine_json_files
+from .json_merger import combine_json_files, iter_combined_records
 
-__all__ = ["combine_json_files"]
+__all__ = ["combine_json_files", "iter_combined_records"]
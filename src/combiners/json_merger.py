@@ -4,9 +4,13 @@ JSON File Combiner
 Combines multiple JSON files from a directory into a single JSON file.
 Supports both list and object JSON formats with comprehensive error handling.
 """
+import os
+import shutil
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Union, Dict, Any, Optional
+from typing import List, Union, Dict, Any, Iterator, Optional
 import time
 
 # Add parent directory to path for imports
@@ -16,7 +20,8 @@ from utils import (
     FileHandlingError,
     validate_directory,
     safe_read_json,
-    safe_write_json,
+    safe_write_json_stream,
+    cached_stat,
     get_matching_files,
     ensure_writable_output,
     setup_logging,
@@ -28,26 +33,198 @@ from utils import (
 
 logger = setup_logging("json_combiner")
 
+# Below this many files the process-pool startup cost outweighs the gain
+_MIN_PARALLEL_FILES = 4
+
 
 class JSONCombinerError(Exception):
     """Custom exception for JSON combiner errors"""
     pass
 
 
+def _parse_json_file(json_file: Path):
+    """
+    Parse a single JSON file for the parallel merge.
+
+    Runs as a process-pool worker, so errors are returned rather than
+    raised: the result is a (data, error) tuple with exactly one side set.
+    """
+    try:
+        # The file list came from the directory scan, so skip the
+        # per-file validation stats and let open() raise if it changed
+        return safe_read_json(json_file, validate=False), None
+    except Exception as e:
+        return None, e
+
+
+def _iter_submission_window(executor, json_files: List[Path], window: int):
+    """
+    Yield (path, (data, error)) keeping at most `window` parses in flight.
+
+    executor.map submits every file up front, so completed futures
+    buffer whole parsed files without bound while the serial consumer
+    drains them; refilling one submission per yielded result instead
+    caps peak memory at about `window` parsed files and still keeps the
+    pool busy. Results come back in file order.
+    """
+    pending = deque()
+    files_iter = iter(json_files)
+    for json_file in files_iter:
+        pending.append((json_file, executor.submit(_parse_json_file, json_file)))
+        if len(pending) >= window:
+            break
+    while pending:
+        json_file, future = pending.popleft()
+        result = future.result()
+        next_file = next(files_iter, None)
+        if next_file is not None:
+            pending.append((next_file, executor.submit(_parse_json_file, next_file)))
+        yield json_file, result
+
+
+def _iter_parsed(json_files: List[Path], parallel: str = "thread"):
+    """
+    Yield (path, (data, error)) pairs, parallelizing when it pays off.
+
+    parallel selects the executor: 'thread' (default) overlaps file I/O
+    and orjson parsing without pickling results between processes,
+    'process' fans parsing out across cores for CPU-bound stdlib
+    parsing, and 'none' forces a serial loop. The merge order always
+    matches the sorted file list.
+    """
+    if not json_files:
+        return
+    if parallel == "none":
+        for json_file in json_files:
+            yield json_file, _parse_json_file(json_file)
+    elif len(json_files) < _MIN_PARALLEL_FILES:
+        # Few files: skip pool sizing, but still submit all reads up
+        # front on a small thread pool so file I/O overlaps the merge
+        with ThreadPoolExecutor(max_workers=len(json_files)) as executor:
+            futures = [executor.submit(_parse_json_file, f) for f in json_files]
+            for json_file, future in zip(json_files, futures):
+                yield json_file, future.result()
+    elif parallel == "process":
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from _iter_submission_window(executor, json_files, workers * 2)
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from _iter_submission_window(executor, json_files, workers)
+
+
+def iter_combined_records(
+    input_dir: Union[str, Path] = ".",
+    pattern: str = "*.json",
+    stats: Optional[Dict[str, Any]] = None,
+    exclude: Optional[str] = None,
+    show_progress: bool = False,
+    parallel: str = "thread",
+    files: Optional[List[Path]] = None
+) -> Iterator[Any]:
+    """
+    Lazily yield records from every JSON file matching a pattern.
+
+    At most a small window of files (bounded by the executor's worker
+    count) is parsed and in flight at a time, so consumers that stream
+    (e.g. CSV converters) never hold the whole combined dataset in
+    memory. Directory validation and the file scan happen eagerly;
+    parsing is deferred until the iterator is consumed.
+
+    Args:
+        input_dir: Directory containing JSON files (default: current directory)
+        pattern: Glob pattern for matching JSON files (default: *.json)
+        stats: Optional dict updated in place with files_found,
+            files_processed, files_skipped, total_size and errors
+        exclude: Filename to skip during the scan
+        show_progress: Display a per-file progress bar while iterating
+        parallel: Parse executor - 'thread' (default), 'process' or 'none'
+        files: Pre-scanned input files; skips the directory scan, so a
+            caller that already matched files does not pay for a second
+            pass (pattern and exclude are ignored when given)
+
+    Returns:
+        Iterator over the records of all matched files
+
+    Raises:
+        FileHandlingError: If the input directory is invalid
+    """
+    if stats is None:
+        stats = {}
+    stats.update(files_processed=0, files_skipped=0, total_size=0)
+    stats.setdefault("errors", [])
+
+    input_path = validate_directory(input_dir)
+    json_files = files if files is not None else get_matching_files(
+        input_path, pattern, exclude=exclude
+    )
+    stats["files_found"] = len(json_files)
+
+    progress = None
+    if show_progress and json_files:
+        progress = ProgressBar(len(json_files), prefix="Combining files")
+
+    def generate():
+        for json_file, (data, error) in _iter_parsed(json_files, parallel):
+            if error is None:
+                # Track file size, served from the directory-scan cache
+                stats["total_size"] += cached_stat(json_file).st_size
+
+                # Stream records to the consumer; parsers hand back
+                # exact list/dict, so the identity check beats a full
+                # isinstance dispatch in the per-file loop
+                if type(data) is list:
+                    logger.debug(f"Added {len(data)} records from {json_file.name}")
+                    yield from data
+                else:
+                    logger.debug(f"Added 1 record from {json_file.name}")
+                    yield data
+
+                stats["files_processed"] += 1
+            elif isinstance(error, FileHandlingError):
+                error_msg = f"Error reading {json_file.name}: {error}"
+                stats["errors"].append(error_msg)
+                logger.warning(error_msg)
+                stats["files_skipped"] += 1
+            else:
+                error_msg = f"Unexpected error with {json_file.name}: {error}"
+                stats["errors"].append(error_msg)
+                logger.error(error_msg)
+                stats["files_skipped"] += 1
+            if progress:
+                progress.update()
+        if progress:
+            progress.finish()
+
+    return generate()
+
+
 def combine_json_files(
     input_dir: Union[str, Path] = ".",
     output_file: Union[str, Path] = "combined.json",
     pattern: str = "*.json",
-    verbose: bool = False
+    verbose: bool = False,
+    pretty: bool = False,
+    parallel: str = "thread",
+    quiet: bool = False
 ) -> Dict[str, Any]:
     """
     Combine multiple JSON files into a single JSON file.
 
+    All paths are resolved up front and opened absolutely; the process
+    working directory is never changed, so the function is reentrant and
+    safe to run concurrently with other work.
+
     Args:
         input_dir: Directory containing JSON files (default: current directory)
         output_file: Name of the output combined JSON file
         pattern: Glob pattern for matching JSON files (default: *.json)
         verbose: Enable verbose logging
+        pretty: Indent the combined output; compact by default, since the
+            combined file is usually an intermediate for further processing
+        parallel: Parse executor - 'thread' (default), 'process' or 'none'
+        quiet: Suppress progress output and informational logging
 
     Returns:
         Dictionary with statistics about the operation
@@ -59,6 +236,8 @@ def combine_json_files(
 
     if verbose:
         logger.setLevel(10)  # DEBUG
+    elif quiet:
+        logger.setLevel(30)  # WARNING
 
     logger.info(f"🚀 Starting JSON file combination...")
     logger.debug(f"Input directory: {input_dir}")
@@ -69,12 +248,6 @@ def combine_json_files(
         # Validate input directory
         input_path = validate_directory(input_dir)
 
-        # Get matching files
-        json_files = get_matching_files(input_path, pattern)
-
-        if not json_files:
-            raise JSONCombinerError(f"No files matching pattern '{pattern}' found in {input_path}")
-
         # Prepare output path
         if Path(output_file).is_absolute():
             output_path = Path(output_file)
@@ -83,75 +256,82 @@ def combine_json_files(
 
         output_path = ensure_writable_output(output_path)
 
-        # Filter out the output file from processing
-        json_files = [f for f in json_files if f != output_path]
-
-        if not json_files:
-            raise JSONCombinerError(f"No input files to process (output file excluded)")
-
-        logger.info(f"📁 Found {len(json_files)} JSON files to combine")
-
-        # Process files
-        combined_data = []
-        files_processed = 0
-        files_skipped = 0
-        errors = []
-        total_size = 0
-
-        progress = ProgressBar(len(json_files), prefix="Combining files")
-
-        for json_file in json_files:
-            try:
-                data = safe_read_json(json_file)
-
-                # Track file size
-                total_size += json_file.stat().st_size
+        exclude = output_path.name if output_path.parent == input_path else None
 
-                # Add data to combined list
-                if isinstance(data, list):
-                    combined_data.extend(data)
-                    logger.debug(f"Added {len(data)} records from {json_file.name}")
-                else:
-                    combined_data.append(data)
-                    logger.debug(f"Added 1 record from {json_file.name}")
-
-                files_processed += 1
-
-            except FileHandlingError as e:
-                error_msg = f"Error reading {json_file.name}: {e}"
-                errors.append(error_msg)
-                logger.warning(error_msg)
-                files_skipped += 1
-            except Exception as e:
-                error_msg = f"Unexpected error with {json_file.name}: {e}"
-                errors.append(error_msg)
-                logger.error(error_msg)
-                files_skipped += 1
-            finally:
-                progress.update()
+        # Scan once; the single-file probe and the streaming merge
+        # below share this file list instead of re-walking the directory
+        json_files = get_matching_files(input_path, pattern, exclude=exclude)
 
-        progress.finish()
+        if not json_files:
+            raise JSONCombinerError(f"No files matching pattern '{pattern}' found in {input_path}")
 
-        if files_processed == 0:
-            raise JSONCombinerError("No files were successfully processed")
+        # A single input that is already a JSON array needs no merging at
+        # all: copy the bytes and skip the serialize half of the work
+        # (the parse only runs once, to count records for the summary)
+        if not pretty:
+            if len(json_files) == 1:
+                single_file = json_files[0]
+                with open(single_file, 'rb') as f:
+                    is_array = f.read(1) == b'['
+                if is_array:
+                    total_records = len(safe_read_json(single_file))
+                    logger.info(f"📁 Single input file; copying {single_file.name} to {output_path.name}")
+                    shutil.copyfile(single_file, output_path)
+
+                    duration = time.time() - start_time
+                    result = {
+                        "files_processed": 1,
+                        "files_skipped": 0,
+                        "total_records": total_records,
+                        "input_size": format_file_size(cached_stat(single_file).st_size),
+                        "output_size": format_file_size(output_path.stat().st_size),
+                        "output_file": str(output_path),
+                        "duration": f"{duration:.2f}s",
+                        "errors": []
+                    }
+                    log_operation_summary(logger, "JSON Combination", result, duration)
+                    return result
+
+        # Stream records from the inputs straight to the output file so
+        # peak memory stays bounded by the parser's small in-flight
+        # window of input files, not the combined dataset
+        stats: Dict[str, Any] = {}
+        records = iter_combined_records(
+            input_path, pattern, stats=stats, exclude=exclude,
+            show_progress=not quiet, parallel=parallel, files=json_files
+        )
 
-        # Write combined output
-        logger.info(f"💾 Writing combined data to {output_path.name}...")
-        safe_write_json(combined_data, output_path, indent=4, backup=False)
+        logger.info(f"📁 Found {stats['files_found']} JSON files to combine")
+
+        # Write combined output to a sibling temp file and move it into
+        # place only on success, so a run where every input fails (or a
+        # crash mid-stream) cannot truncate a previous combined file
+        logger.info(f"💾 Streaming combined data to {output_path.name}...")
+        tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+        try:
+            total_records = safe_write_json_stream(
+                records, tmp_path, indent=4 if pretty else 0
+            )
+            if stats["files_processed"] == 0:
+                raise JSONCombinerError("No files were successfully processed")
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, output_path)
 
         # Calculate statistics
         duration = time.time() - start_time
         output_size = output_path.stat().st_size
 
         result = {
-            "files_processed": files_processed,
-            "files_skipped": files_skipped,
-            "total_records": len(combined_data),
-            "input_size": format_file_size(total_size),
+            "files_processed": stats["files_processed"],
+            "files_skipped": stats["files_skipped"],
+            "total_records": total_records,
+            "input_size": format_file_size(stats["total_size"]),
             "output_size": format_file_size(output_size),
             "output_file": str(output_path),
             "duration": f"{duration:.2f}s",
-            "errors": errors
+            "errors": stats["errors"]
         }
 
         # Log summary
@@ -207,6 +387,17 @@ Examples:
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the combined output (larger and slower to write)"
+    )
+    parser.add_argument(
+        "--parallel",
+        choices=["thread", "process", "none"],
+        default="thread",
+        help="Executor for per-file parsing (default: thread)"
+    )
 
     args = parser.parse_args()
 
@@ -215,7 +406,9 @@ Examples:
             args.input_dir,
             args.output,
             args.pattern,
-            args.verbose
+            args.verbose,
+            pretty=args.pretty,
+            parallel=args.parallel
         )
         sys.exit(0)
     except JSONCombinerError as e:
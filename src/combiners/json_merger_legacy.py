@@ -5,9 +5,9 @@ Combines multiple JSON files from a directory into a single JSON file.
 Supports both list and object JSON formats with comprehensive error handling.
 """
 import sys
+import itertools
 from pathlib import Path
-from typing import List, Union, Dict, Any, Optional
-import time
+from typing import Union, Dict, Any
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,7 +22,6 @@ from utils import (
     setup_logging,
     log_operation_summary,
     ProgressBar,
-    format_file_size,
 )
 
 
@@ -55,8 +54,6 @@ def combine_json_files(
     Raises:
         JSONCombinerError: If operation fails
     """
-    start_time = time.time()
-
     if verbose:
         logger.setLevel(10)  # DEBUG
 
@@ -91,8 +88,10 @@ def combine_json_files(
 
         logger.info(f"📁 Found {len(json_files)} JSON files to combine")
 
-        # Process files
-        combined_data = []
+        # Process files, collecting per-file record lists; flattening once
+        # at the end sizes the combined list in a single allocation instead
+        # of repeated geometric growth from in-loop extend/append
+        parts = []
         files_processed = 0
         files_skipped = 0
         errors = []
@@ -102,41 +101,43 @@ def combine_json_files(
         for json_file in json_files:
             try:
                 data = safe_read_json(json_file)
-                if isinstance(data, list):
-                    combined_data.extend(data)
-                else:
-                    combined_data.append(data)
+                parts.append(data if type(data) is list else [data])
                 files_processed += 1
-        except json.JSONDecodeError as e:
-            error_msg = f"Error reading {file_name}: {e}"
-            errors.append(error_msg)
-            print(f"⚠️ {error_msg}")
-            files_skipped += 1
-        except Exception as e:
-            error_msg = f"Unexpected error with {file_name}: {e}"
-            errors.append(error_msg)
-            print(f"⚠️ {error_msg}")
-            files_skipped += 1
-
-    # Write the combined JSON file
-    output_path = input_path / output_file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(combined_data, f, indent=4, ensure_ascii=False)
-
-    result = {
-        "files_processed": files_processed,
-        "files_skipped": files_skipped,
-        "total_records": len(combined_data),
-        "output_file": str(output_path),
-        "errors": errors
-    }
-
-    print(f"✅ Combined {files_processed} files into {output_file}")
-    print(f"📊 Total records: {len(combined_data)}")
-    if files_skipped > 0:
-        print(f"⚠️ Skipped {files_skipped} files due to errors")
-
-    return result
+            except FileHandlingError as e:
+                error_msg = f"Error reading {json_file.name}: {e}"
+                errors.append(error_msg)
+                logger.warning(error_msg)
+                files_skipped += 1
+            except Exception as e:
+                error_msg = f"Unexpected error with {json_file.name}: {e}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+                files_skipped += 1
+            finally:
+                progress.update()
+
+        progress.finish()
+
+        combined_data = list(itertools.chain.from_iterable(parts))
+
+        # Write the combined JSON file
+        safe_write_json(combined_data, output_path, indent=4, backup=False)
+
+        result = {
+            "files_processed": files_processed,
+            "files_skipped": files_skipped,
+            "total_records": len(combined_data),
+            "output_file": str(output_path),
+            "errors": errors
+        }
+
+        # One structured summary instead of a print per statistic
+        log_operation_summary(logger, "JSON Combination", result)
+
+        return result
+
+    except FileHandlingError as e:
+        raise JSONCombinerError(f"File handling error: {e}")
 
 
 if __name__ == "__main__":
@@ -9,9 +9,40 @@ import glob
 import json
 import csv
 import argparse
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+# Optional accelerated JSON backend - falls back to stdlib json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Whitespace normalization table, compiled once; one C-level translate
+# pass replaces the chained per-call str.replace copies
+_WS_TABLE = str.maketrans({"\r": " ", "\n": " ", "\t": " "})
+
+
+# CSV column order; build_row returns values in this order
+FIELDNAMES = (
+    "companyName",
+    "industry",
+    "employeeCountRange",
+    "employeeDisplayCount",
+    "listCount",
+    "saved",
+    "entityUrn",
+    "linkedin_url",
+    "recipeType",
+    "trackingId",
+    "description",
+    "logo_100",
+    "logo_200",
+    "logo_400",
+    "spotlightBadges",
+    "source_file",
+)
+
 
 def pick_artifact_url(pic: Optional[Dict], target_width: int) -> str:
     """
@@ -28,11 +59,18 @@ def pick_artifact_url(pic: Optional[Dict], target_width: int) -> str:
         return ""
     root = pic.get("rootUrl")
     artifacts = pic.get("artifacts") or []
-    chosen = next((a for a in artifacts if a.get("width") == target_width), None)
-    if not chosen and artifacts:
+    # Plain loop with an early break; no generator frame per call
+    chosen = None
+    for a in artifacts:
+        if a.get("width") == target_width:
+            chosen = a
+            break
+    if chosen is None and artifacts:
         chosen = artifacts[0]
-    if root and chosen and chosen.get("fileIdentifyingUrlPathSegment"):
-        return root + chosen["fileIdentifyingUrlPathSegment"]
+    if root and chosen:
+        segment = chosen.get("fileIdentifyingUrlPathSegment")
+        if segment:
+            return root + segment
     return ""
 
 
@@ -69,8 +107,7 @@ def normalize_text(val: Any) -> str:
     """
     if val is None:
         return ""
-    s = str(val)
-    return " ".join(s.replace("\r", " ").replace("\n", " ").split()).strip()
+    return " ".join(str(val).translate(_WS_TABLE).split())
 
 
 def build_linkedin_url(entity_urn: str) -> str:
@@ -89,40 +126,40 @@ def build_linkedin_url(entity_urn: str) -> str:
     return f"https://www.linkedin.com/sales/company/{company_code}"
 
 
-def build_row(rec: Dict[str, Any], source_file: str) -> Dict[str, Any]:
+def build_row(rec: Dict[str, Any], source_file: str) -> Tuple[Any, ...]:
     """
     Build a flattened row from a JSON record.
 
     Args:
         rec: JSON record dictionary
-        source_file: Name of the source file
+        source_file: Basename of the source file, computed once per file
+            by the caller
 
     Returns:
-        Flattened dictionary suitable for CSV output
+        Row tuple in FIELDNAMES order, suitable for csv.writer
     """
     pic = rec.get("companyPictureDisplayImage") or {}
     badges = rec.get("spotlightBadges") or []
     entity_urn = rec.get("entityUrn", "")
 
-    row = {
-        "companyName": rec.get("companyName", ""),
-        "industry": rec.get("industry", ""),
-        "employeeCountRange": rec.get("employeeCountRange", ""),
-        "employeeDisplayCount": rec.get("employeeDisplayCount", ""),
-        "listCount": rec.get("listCount", ""),
-        "saved": rec.get("saved", ""),
-        "entityUrn": entity_urn,
-        "linkedin_url": build_linkedin_url(entity_urn),
-        "recipeType": rec.get("$recipeType", ""),
-        "trackingId": rec.get("trackingId", ""),
-        "description": normalize_text(rec.get("description", "")),
-        "logo_100": pick_artifact_url(pic, 100),
-        "logo_200": pick_artifact_url(pic, 200),
-        "logo_400": pick_artifact_url(pic, 400),
-        "spotlightBadges": join_badges(badges),
-        "source_file": os.path.basename(source_file),
-    }
-    return row
+    return (
+        rec.get("companyName", ""),
+        rec.get("industry", ""),
+        rec.get("employeeCountRange", ""),
+        rec.get("employeeDisplayCount", ""),
+        rec.get("listCount", ""),
+        rec.get("saved", ""),
+        entity_urn,
+        build_linkedin_url(entity_urn),
+        rec.get("$recipeType", ""),
+        rec.get("trackingId", ""),
+        normalize_text(rec.get("description", "")),
+        pick_artifact_url(pic, 100),
+        pick_artifact_url(pic, 200),
+        pick_artifact_url(pic, 400),
+        join_badges(badges),
+        source_file,
+    )
 
 
 def convert_json_to_csv(
@@ -141,64 +178,56 @@ def convert_json_to_csv(
     Returns:
         Dictionary with statistics about the conversion
     """
+    # Compose paths explicitly; chdir would leak process-global state
     if input_dir:
-        os.chdir(input_dir)
-
-    files = sorted(glob.glob(input_pattern))
+        files = sorted(glob.glob(os.path.join(input_dir, input_pattern)))
+        if not os.path.isabs(output_file):
+            output_file = os.path.join(input_dir, output_file)
+    else:
+        files = sorted(glob.glob(input_pattern))
     if not files:
         print(f"⚠️ No files match pattern: {input_pattern}")
         return {"files_processed": 0, "rows_written": 0}
 
-    fieldnames = [
-        "companyName",
-        "industry",
-        "employeeCountRange",
-        "employeeDisplayCount",
-        "listCount",
-        "saved",
-        "entityUrn",
-        "linkedin_url",
-        "recipeType",
-        "trackingId",
-        "description",
-        "logo_100",
-        "logo_200",
-        "logo_400",
-        "spotlightBadges",
-        "source_file",
-    ]
-
-    rows = []
+    rows_written = 0
     files_processed = 0
     files_skipped = 0
 
-    for path in files:
-        if os.path.basename(path) == output_file:
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            files_processed += 1
-        except Exception as e:
-            print(f"⚠️ Skipping {path}: {e}")
-            files_skipped += 1
-            continue
-
-        if isinstance(data, list):
-            records = data
-        else:
-            records = [data]
-
-        for rec in records:
-            if isinstance(rec, dict):
-                rows.append(build_row(rec, path))
-
-    with open(output_file, "w", encoding="utf-8", newline="") as out:
-        writer = csv.DictWriter(out, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"✅ Wrote {len(rows)} rows into {output_file}")
+    # Stream rows per file into the writer instead of buffering them all
+    # 1 MiB buffer so row writes flush in large chunks
+    with open(output_file, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+        writer = csv.writer(out)
+        writer.writerow(FIELDNAMES)
+
+        output_name = os.path.basename(output_file)
+        for path in files:
+            if os.path.basename(path) == output_name:
+                continue
+            try:
+                if orjson is not None:
+                    with open(path, "rb") as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                files_processed += 1
+            except Exception as e:
+                print(f"⚠️ Skipping {path}: {e}")
+                files_skipped += 1
+                continue
+
+            if isinstance(data, list):
+                records = data
+            else:
+                records = [data]
+
+            source_name = os.path.basename(path)
+            for rec in records:
+                if isinstance(rec, dict):
+                    writer.writerow(build_row(rec, source_name))
+                    rows_written += 1
+
+    print(f"✅ Wrote {rows_written} rows into {output_file}")
     print(f"📊 Processed {files_processed} files")
     if files_skipped > 0:
         print(f"⚠️ Skipped {files_skipped} files due to errors")
@@ -206,7 +235,7 @@ def convert_json_to_csv(
     return {
         "files_processed": files_processed,
         "files_skipped": files_skipped,
-        "rows_written": len(rows),
+        "rows_written": rows_written,
         "output_file": output_file
     }
 
@@ -0,0 +1,191 @@
+"""
+Fused Combine-and-Convert Pipeline
+
+Streams records from a directory of JSON export files straight into a
+CSV file. The two-step workflow writes a combined JSON file and then
+re-reads it for conversion, moving the whole dataset through the disk
+twice; fusing the steps halves the I/O and skips one JSON
+encode/decode round trip.
+"""
+import csv
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Union
+
+# Add this directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from converters.linkedin_to_csv_enhanced import LinkedInDataExtractor
+from utils import (
+    FileHandlingError,
+    validate_directory,
+    safe_read_json,
+    get_matching_files,
+    ensure_writable_output,
+    setup_logging,
+    log_operation_summary,
+    ProgressBar,
+)
+
+
+logger = setup_logging("pipeline")
+
+
+class PipelineError(Exception):
+    """Custom exception for pipeline errors"""
+    pass
+
+
+def combine_to_csv(
+    input_dir: Union[str, Path] = ".",
+    output_csv: Union[str, Path] = "companies.csv",
+    pattern: str = "*.json",
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Convert a directory of JSON export files directly to a single CSV.
+
+    Records stream from each parsed input file straight into the CSV
+    writer, so no intermediate combined JSON file is written or re-read.
+
+    Args:
+        input_dir: Directory containing JSON files (default: current directory)
+        output_csv: Name of the output CSV file
+        pattern: Glob pattern for matching JSON files (default: *.json)
+        verbose: Enable verbose logging
+
+    Returns:
+        Dictionary with statistics about the operation
+
+    Raises:
+        PipelineError: If operation fails
+    """
+    start_time = time.time()
+
+    if verbose:
+        logger.setLevel(10)  # DEBUG
+
+    logger.info(f"🚀 Starting fused combine-and-convert pipeline...")
+
+    try:
+        # Validate input directory and output path
+        input_path = validate_directory(input_dir)
+
+        if Path(output_csv).is_absolute():
+            output_path = Path(output_csv)
+        else:
+            output_path = input_path / output_csv
+
+        output_path = ensure_writable_output(output_path)
+
+        exclude = output_path.name if output_path.parent == input_path else None
+        json_files = get_matching_files(input_path, pattern, exclude=exclude)
+
+        if not json_files:
+            raise PipelineError(f"No files matching pattern '{pattern}' found in {input_path}")
+
+        logger.info(f"📁 Found {len(json_files)} JSON files to convert")
+
+        extractor = LinkedInDataExtractor(verbose=verbose)
+        files_processed = 0
+        files_skipped = 0
+        rows_written = 0
+        errors = []
+
+        progress = ProgressBar(len(json_files), prefix="Converting files")
+
+        # 1 MiB buffer so row writes flush in large chunks
+        with open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+            writer = csv.writer(out)
+            writer.writerow(LinkedInDataExtractor.CSV_FIELDS)
+
+            for json_file in json_files:
+                try:
+                    data = safe_read_json(json_file, validate=False)
+                except FileHandlingError as e:
+                    error_msg = f"Error reading {json_file.name}: {e}"
+                    errors.append(error_msg)
+                    logger.warning(error_msg)
+                    files_skipped += 1
+                    progress.update()
+                    continue
+
+                # extract_rows carries the per-record error handling, so
+                # one malformed record is counted, not fatal mid-write
+                records = data if type(data) is list else [data]
+                for row in extractor.extract_rows(records, json_file.name):
+                    writer.writerow(row)
+                    rows_written += 1
+
+                files_processed += 1
+                progress.update()
+
+        progress.finish()
+
+        if files_processed == 0:
+            raise PipelineError("No files were successfully processed")
+
+        duration = time.time() - start_time
+
+        result = {
+            "files_processed": files_processed,
+            "files_skipped": files_skipped,
+            "rows_written": rows_written,
+            "duplicate_records": extractor.stats['duplicate_records'],
+            "extraction_errors": extractor.stats['extraction_errors'],
+            "output_file": str(output_path),
+            "duration": f"{duration:.2f}s",
+            "errors": errors
+        }
+
+        log_operation_summary(logger, "Combine and Convert", result, duration)
+
+        return result
+
+    except FileHandlingError as e:
+        logger.error(f"File handling error: {e}")
+        raise PipelineError(f"File handling error: {e}")
+
+
+def main():
+    """Main entry point for command-line usage"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert a directory of JSON export files directly to CSV"
+    )
+    parser.add_argument(
+        "--input-dir",
+        default=".",
+        help="Directory containing JSON files (default: current directory)"
+    )
+    parser.add_argument(
+        "--output",
+        default="companies.csv",
+        help="Output CSV filename (default: companies.csv)"
+    )
+    parser.add_argument(
+        "--pattern",
+        default="*.json",
+        help="Glob pattern for matching files (default: *.json)"
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose output"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        combine_to_csv(args.input_dir, args.output, args.pattern, args.verbose)
+        sys.exit(0)
+    except PipelineError as e:
+        logger.error(f"❌ Pipeline failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ from .file_utils import (
     validate_file,
     safe_read_json,
     safe_write_json,
+    safe_write_json_stream,
+    cached_stat,
+    iter_matching_files,
     get_matching_files,
     ensure_writable_output,
     get_file_size_mb,
@@ -19,6 +22,7 @@ from .file_utils import (
 from .logging_utils import (
     setup_logging,
     log_operation_summary,
+    dlog,
 )
 
 from .progress_utils import (
@@ -34,6 +38,9 @@ __all__ = [
     "validate_file",
     "safe_read_json",
     "safe_write_json",
+    "safe_write_json_stream",
+    "cached_stat",
+    "iter_matching_files",
     "get_matching_files",
     "ensure_writable_output",
     "get_file_size_mb",
@@ -41,6 +48,7 @@ __all__ = [
     # Logging utilities
     "setup_logging",
     "log_operation_summary",
+    "dlog",
     # Progress utilities
     "ProgressBar",
     "progress_context",
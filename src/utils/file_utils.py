@@ -3,14 +3,38 @@ File handling utilities for data extraction tools
 
 Provides safe file operations with validation and error handling.
 """
+import io
 import os
 import json
+import mmap
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 import logging
 
+# Optional accelerated JSON backend - falls back to stdlib json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Files below this size are read outright; mmap setup would cost more
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Large write buffer so combined outputs flush in few big write syscalls
+# rather than the default 8 KiB chunks
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Lists at least this long take the record-at-a-time encoder on the
+# stdlib fallback path instead of one recursive json.dump call
+_STREAM_DUMP_MIN_RECORDS = 10_000
+
+# stat results collected during directory scans, so later size lookups
+# for the same files are served from memory instead of extra syscalls
+_stat_cache: Dict[Path, os.stat_result] = {}
+
 
 class FileHandlingError(Exception):
     """Custom exception for file handling errors"""
@@ -89,12 +113,16 @@ def validate_file(file_path: Union[str, Path], must_exist: bool = True) -> Path:
     return path
 
 
-def safe_read_json(file_path: Union[str, Path]) -> Any:
+def safe_read_json(file_path: Union[str, Path], validate: bool = True) -> Any:
     """
     Safely read and parse a JSON file.
 
     Args:
         file_path: Path to JSON file
+        validate: Run the full path validation (resolve plus access
+            checks, several stat syscalls per file). Callers whose
+            paths came from a directory scan can pass False and let
+            open() raise if anything changed since.
 
     Returns:
         Parsed JSON data
@@ -102,11 +130,27 @@ def safe_read_json(file_path: Union[str, Path]) -> Any:
     Raises:
         FileHandlingError: If file cannot be read or parsed
     """
-    path = validate_file(file_path, must_exist=True)
+    if validate:
+        path = validate_file(file_path, must_exist=True)
+    else:
+        path = Path(file_path)
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            # Memory-map large files so the parser consumes page-cache
+            # bytes directly instead of an intermediate copy
+            if cached_stat(path).st_size >= _MMAP_MIN_SIZE:
+                with open(path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = orjson.loads(memoryview(mm))
+            else:
+                data = orjson.loads(path.read_bytes())
+        else:
+            # Binary read: json.load detects the encoding itself, and
+            # skipping the text layer avoids newline translation plus
+            # an incremental decode pass over the whole file
+            with open(path, 'rb') as f:
+                data = json.load(f)
         logger.debug(f"Successfully read JSON file: {path}")
         return data
     except json.JSONDecodeError as e:
@@ -127,7 +171,7 @@ def safe_write_json(
     Args:
         data: Data to write
         file_path: Path to output file
-        indent: JSON indentation level
+        indent: JSON indentation level (orjson backend uses 2-space indent)
         backup: If True and file exists, create backup first
 
     Returns:
@@ -148,48 +192,195 @@ def safe_write_json(
             raise FileHandlingError(f"Failed to create backup: {e}")
 
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        if orjson is not None:
+            # orjson serializes straight to UTF-8 bytes; write them as-is
+            # rather than decoding and re-encoding through a text layer
+            option = orjson.OPT_INDENT_2 if indent else 0
+            with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(data, option=option))
+        elif type(data) is list and len(data) >= _STREAM_DUMP_MIN_RECORDS:
+            # stdlib json.dump encodes the whole structure in one
+            # recursive pass; for large lists, loop over records via the
+            # stream writer so each encode call stays small and the
+            # traversal is an explicit loop rather than deep recursion
+            safe_write_json_stream(data, path, indent=indent)
+            return path
+        else:
+            with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as raw:
+                with io.TextIOWrapper(raw, encoding='utf-8') as f:
+                    if indent:
+                        json.dump(data, f, indent=indent, ensure_ascii=False)
+                    else:
+                        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
         logger.info(f"Successfully wrote JSON file: {path}")
         return path
     except Exception as e:
         raise FileHandlingError(f"Failed to write file '{path}': {e}")
 
 
-def get_matching_files(
+def safe_write_json_stream(
+    records: Any,
+    file_path: Union[str, Path],
+    indent: int = 4
+) -> int:
+    """
+    Incrementally write an iterable of records as a JSON array.
+
+    Unlike safe_write_json, records are serialized one at a time, so peak
+    memory stays bounded by the largest single record rather than the
+    whole dataset.
+
+    Args:
+        records: Iterable of JSON-serializable records
+        file_path: Path to output file
+        indent: JSON indentation level (orjson backend uses 2-space indent)
+
+    Returns:
+        Number of records written
+
+    Raises:
+        FileHandlingError: If file cannot be written
+    """
+    path = validate_file(file_path, must_exist=False)
+    count = 0
+
+    try:
+        with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            pad = b' ' * (2 if orjson is not None else indent) if indent else b''
+            f.write(b'[')
+            for record in records:
+                if count:
+                    f.write(b',')
+                if indent:
+                    f.write(b'\n' + pad)
+                f.write(_dump_record(record, indent))
+                count += 1
+            if indent and count:
+                f.write(b'\n')
+            f.write(b']')
+        logger.info(f"Successfully wrote JSON file: {path}")
+        return count
+    except Exception as e:
+        raise FileHandlingError(f"Failed to write file '{path}': {e}")
+
+
+def _dump_record(record: Any, indent: int) -> bytes:
+    """Serialize a single record to UTF-8, re-indented for streaming"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        text = orjson.dumps(record, option=option)
+        pad = b' ' * 2
+    elif indent:
+        text = json.dumps(record, indent=indent, ensure_ascii=False).encode('utf-8')
+        pad = b' ' * indent
+    else:
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if indent:
+        text = text.replace(b'\n', b'\n' + pad)
+    return text
+
+
+def cached_stat(file_path: Union[str, Path]) -> os.stat_result:
+    """
+    Return stat information for a file, reusing results collected while
+    scanning directories so repeated size lookups cost no extra syscalls.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        os.stat_result for the file
+    """
+    path = Path(file_path)
+    st = _stat_cache.get(path)
+    if st is None:
+        st = path.stat()
+        _stat_cache[path] = st
+    return st
+
+
+def iter_matching_files(
     directory: Union[str, Path],
     pattern: str = "*.json",
-    recursive: bool = False
-) -> List[Path]:
+    recursive: bool = False,
+    exclude: Optional[str] = None
+):
     """
-    Get list of files matching a pattern in a directory.
+    Lazily yield files matching a pattern in a directory.
+
+    Paths stream out in directory order as the scan proceeds, so huge
+    directories need no up-front list and processing can start before
+    enumeration finishes. Callers that need deterministic (sorted)
+    order should use get_matching_files instead.
 
     Args:
         directory: Directory to search
         pattern: Glob pattern for matching files
         recursive: If True, search recursively
+        exclude: Filename to skip during the scan (e.g. an output file
+            that would otherwise match the pattern)
 
     Returns:
-        List of matching file paths
+        Iterator of matching file paths
 
     Raises:
         FileHandlingError: If directory is invalid
     """
     dir_path = validate_directory(directory)
 
-    try:
-        if recursive:
-            files = list(dir_path.rglob(pattern))
-        else:
-            files = list(dir_path.glob(pattern))
+    def generate():
+        try:
+            if recursive:
+                for f in dir_path.rglob(pattern):
+                    if f.is_file() and f.name != exclude:
+                        yield f
+            else:
+                # One scandir pass yields both the name match and a
+                # cached stat per entry, instead of readdir plus a stat
+                # per file. Each scan starts a fresh cache so entries
+                # never go stale across operations.
+                _stat_cache.clear()
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name == exclude:
+                            continue
+                        if fnmatch(entry.name, pattern) and entry.is_file():
+                            path = dir_path / entry.name
+                            _stat_cache[path] = entry.stat()
+                            yield path
+        except FileHandlingError:
+            raise
+        except Exception as e:
+            raise FileHandlingError(f"Failed to search directory '{dir_path}': {e}")
 
-        # Filter out directories, only return files
-        files = [f for f in files if f.is_file()]
+    return generate()
 
-        logger.debug(f"Found {len(files)} files matching '{pattern}' in {dir_path}")
-        return sorted(files)
-    except Exception as e:
-        raise FileHandlingError(f"Failed to search directory '{dir_path}': {e}")
+
+def get_matching_files(
+    directory: Union[str, Path],
+    pattern: str = "*.json",
+    recursive: bool = False,
+    exclude: Optional[str] = None
+) -> List[Path]:
+    """
+    Get a sorted list of files matching a pattern in a directory.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob pattern for matching files
+        recursive: If True, search recursively
+        exclude: Filename to skip during the scan (e.g. an output file
+            that would otherwise match the pattern)
+
+    Returns:
+        List of matching file paths
+
+    Raises:
+        FileHandlingError: If directory is invalid
+    """
+    files = sorted(iter_matching_files(directory, pattern, recursive, exclude))
+    logger.debug(f"Found {len(files)} files matching '{pattern}' in {directory}")
+    return files
 
 
 def ensure_writable_output(file_path: Union[str, Path]) -> Path:
@@ -3,13 +3,34 @@ Logging configuration for data extraction tools
 
 Provides consistent logging setup across all modules.
 """
+import atexit
+import functools
 import logging
+import os
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Optional
 from datetime import datetime
 
 
+# Summary banner separator, built once
+_SEP = '=' * 60
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_key(key: str) -> str:
+    """Memoized stat-key prettifier for summary output"""
+    return key.replace('_', ' ').title()
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Stop a queue listener, tolerating repeated calls"""
+    if listener._thread is not None:
+        listener.stop()
+
+
 class ColoredFormatter(logging.Formatter):
     """Colored log formatter for terminal output"""
 
@@ -30,11 +51,23 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '🔥',
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Pre-render the decorated levelnames once; format() then does a
+        # dict lookup instead of rebuilding icon+color+reset per record
+        self._colored = {
+            level: f"{self.ICONS.get(level, '')} {color}{level}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
+        # Escape codes only help a terminal; piped or redirected output
+        # (and the NO_COLOR convention) gets plain levelnames
+        self._use_color = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
     def format(self, record):
+        if not self._use_color:
+            return super().format(record)
         # Add color and icon
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.ICONS.get(levelname, '')} {self.COLORS[levelname]}{levelname}{self.RESET}"
+        record.levelname = self._colored.get(record.levelname, record.levelname)
         return super().format(record)
 
 
@@ -60,9 +93,16 @@ def setup_logging(
         level = logging.DEBUG
 
     logger = logging.getLogger(name)
-    logger.setLevel(level)
-
-    # Remove existing handlers
+    # With a DEBUG file handler attached the logger itself must pass
+    # DEBUG records through; without one, keeping the logger at the
+    # console level lets logger.debug() short-circuit immediately
+    logger.setLevel(logging.DEBUG if log_file else level)
+
+    # Remove existing handlers, stopping any previous queue listener
+    listener = getattr(logger, "_listener", None)
+    if listener is not None:
+        _stop_listener(listener)
+        logger._listener = None
     logger.handlers.clear()
 
     # Console handler with colored output
@@ -74,7 +114,9 @@ def setup_logging(
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
-    # File handler if requested
+    # File handler if requested; callers log to an in-memory queue and
+    # a background listener thread drains it into the file, so the hot
+    # path never blocks on a write() syscall
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)  # Always debug in file
@@ -82,11 +124,37 @@ def setup_logging(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        log_queue: SimpleQueue = SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        # Drain the queue on interpreter exit; also kept on the logger
+        # so callers can stop/flush explicitly
+        atexit.register(_stop_listener, listener)
+        logger._listener = listener
 
     return logger
 
 
+def dlog(logger: logging.Logger, message_fn) -> None:
+    """
+    Log a DEBUG message whose construction is expensive.
+
+    The callable runs only when DEBUG is actually enabled, so hot paths
+    can defer building the message entirely:
+
+        dlog(logger, lambda: f"parsed {expensive_summary(data)}")
+
+    Args:
+        logger: Logger instance
+        message_fn: Zero-argument callable returning the message
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message_fn())
+
+
 def log_operation_summary(
     logger: logging.Logger,
     operation: str,
@@ -102,16 +170,20 @@ def log_operation_summary(
         stats: Dictionary of statistics to log
         duration: Optional duration in seconds
     """
-    logger.info(f"\n{'='*60}")
-    logger.info(f"📊 {operation} - Summary")
-    logger.info(f"{'='*60}")
+    # Skip all formatting when INFO is filtered out anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info("\n%s", _SEP)
+    logger.info("📊 %s - Summary", operation)
+    logger.info(_SEP)
 
     for key, value in stats.items():
-        # Format key nicely
-        formatted_key = key.replace('_', ' ').title()
-        logger.info(f"  {formatted_key}: {value}")
+        # Keys repeat across calls, so the title-cased form is memoized;
+        # %-style args defer the interpolation to the handler
+        logger.info("  %s: %s", _fmt_key(key), value)
 
     if duration:
-        logger.info(f"  Duration: {duration:.2f}s")
+        logger.info("  Duration: %.2fs", duration)
 
-    logger.info(f"{'='*60}\n")
+    logger.info("%s\n", _SEP)
@@ -17,7 +17,8 @@ class ProgressBar:
         total: int,
         prefix: str = "Progress",
         length: int = 50,
-        fill: str = "█"
+        fill: str = "█",
+        disabled: bool = False
     ):
         """
         Initialize progress bar.
@@ -27,13 +28,30 @@ class ProgressBar:
             prefix: Prefix text for progress bar
             length: Character length of bar
             fill: Character to use for filled portion
+            disabled: Render nothing; updates become no-ops, for quiet
+                or batch runs where terminal output is pure overhead
         """
+        self.disabled = disabled
         self.total = total
         self.prefix = prefix
         self.length = length
         self.fill = fill
         self.current = 0
-        self.start_time = time.time()
+        # Monotonic clock: immune to wall-clock jumps (NTP, DST)
+        self.start_time = time.monotonic()
+        # Redraw throttling state: skip terminal writes unless the
+        # shown percent changed or enough time passed
+        self._last_percent = -1
+        self._last_draw = 0.0
+        self._min_interval = 0.05
+        # All length+1 bar fills, rendered once; update() indexes this
+        # table instead of allocating two strings per draw
+        self._bars = tuple(
+            fill * i + '-' * (length - i) for i in range(length + 1)
+        )
+        # %-format template with prefix and total baked in; cheaper than
+        # re-interpolating the constants through an f-string per draw
+        self._template = f'\r{prefix} |%s| %d%% (%d/{total}) %s'
 
     def update(self, current: Optional[int] = None):
         """
@@ -42,24 +60,37 @@ class ProgressBar:
         Args:
             current: Current progress (if None, increment by 1)
         """
+        if self.disabled:
+            return
         if current is not None:
             self.current = current
         else:
             self.current += 1
 
         percent = min(100, (self.current * 100) // self.total)
+        now = time.monotonic()
+
+        # Coalesce updates: one stdout write per percent step (or per
+        # 50 ms), not one per item; the final update always draws
+        if (self.current < self.total
+                and percent == self._last_percent
+                and now - self._last_draw < self._min_interval):
+            return
+        self._last_percent = percent
+        self._last_draw = now
+
         filled_length = (self.length * self.current) // self.total
-        bar = self.fill * filled_length + '-' * (self.length - filled_length)
+        bar = self._bars[min(filled_length, self.length)]
 
-        # Calculate ETA
-        elapsed = time.time() - self.start_time
-        if self.current > 0:
-            eta = (elapsed / self.current) * (self.total - self.current)
-            eta_str = f"ETA: {eta:.1f}s"
+        # Calculate ETA from the rate, reusing the clock read above
+        elapsed = now - self.start_time
+        if self.current > 0 and elapsed > 0:
+            rate = self.current / elapsed
+            eta_str = f"ETA: {(self.total - self.current) / rate:.1f}s"
         else:
             eta_str = "ETA: --"
 
-        sys.stdout.write(f'\r{self.prefix} |{bar}| {percent}% ({self.current}/{self.total}) {eta_str}')
+        sys.stdout.write(self._template % (bar, percent, self.current, eta_str))
         sys.stdout.flush()
 
         if self.current >= self.total:
@@ -88,25 +119,28 @@ def progress_context(iterable: Iterator[Any], prefix: str = "Processing", total:
             for item in items:
                 # Process item
     """
-    try:
-        items = list(iterable)
-    except TypeError:
-        # Not a list, try to get length
-        items = iterable
-
+    # Preserve laziness: only generators with no usable length get
+    # materialized, so sized inputs cost no extra copy
     if total is None:
         try:
-            total = len(items)
+            total = len(iterable)
+            items = iterable
         except TypeError:
-            total = 0
+            items = list(iterable)
+            total = len(items)
+    else:
+        items = iterable
 
     if total > 0:
         progress = ProgressBar(total, prefix=prefix)
 
         def tracked_items():
+            # Bind the bound method once; the loop then avoids an
+            # attribute lookup per item
+            update = progress.update
             for item in items:
                 yield item
-                progress.update()
+                update()
 
         yield tracked_items()
         progress.finish()
@@ -130,14 +164,18 @@ class Spinner:
         self.message = message
         self.frame_index = 0
         self.active = False
+        # Pre-render every frame line once; spin() becomes a table
+        # lookup and an index bump instead of an f-string per tick
+        self._frame_count = len(self.FRAMES)
+        self._rendered = tuple(f'\r{frame} {message}' for frame in self.FRAMES)
+        self._clear = '\r' + ' ' * (len(message) + 3) + '\r'
 
     def spin(self):
         """Update spinner frame"""
         if self.active:
-            frame = self.FRAMES[self.frame_index]
-            sys.stdout.write(f'\r{frame} {self.message}')
+            sys.stdout.write(self._rendered[self.frame_index])
             sys.stdout.flush()
-            self.frame_index = (self.frame_index + 1) % len(self.FRAMES)
+            self.frame_index = (self.frame_index + 1) % self._frame_count
 
     def start(self):
         """Start spinner"""
@@ -155,5 +193,5 @@ class Spinner:
         if final_message:
             sys.stdout.write(f'\r{final_message}\n')
         else:
-            sys.stdout.write('\r' + ' ' * (len(self.message) + 3) + '\r')
+            sys.stdout.write(self._clear)
         sys.stdout.flush()
@@ -6,47 +6,54 @@ or: python -m unittest discover tests/
 """
 
 import unittest
+import csv
 import json
 import os
 import tempfile
-import shutil
 from pathlib import Path
 import sys
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from combiners.json_combiner import combine_json_files
-from converters.linkedin_json_to_csv import (
+from combiners.json_merger import (
+    combine_json_files,
+    iter_combined_records,
+    JSONCombinerError
+)
+from converters.linkedin_to_csv import (
     pick_artifact_url,
     join_badges,
     normalize_text,
     build_linkedin_url
 )
+from converters.linkedin_to_csv_enhanced import convert_json_to_csv as convert_json_to_csv_enhanced
+from pipeline import combine_to_csv
+from utils.file_utils import safe_write_json_stream
 
 
 class TestJSONCombiner(unittest.TestCase):
     """Test cases for JSON combiner"""
 
-    def setUp(self):
-        """Create temporary directory with test files"""
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create the fixture directory once for the whole class"""
+        # The tests never mutate the inputs, so the three fixture files
+        # are written once per class instead of once per test method.
+        # TemporaryDirectory cleans itself up even on interrupted runs
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.test_dir = tmp.name
 
-        # Create test JSON files
         test_data1 = [{"id": 1, "name": "Test1"}]
         test_data2 = [{"id": 2, "name": "Test2"}]
         test_data3 = {"id": 3, "name": "Test3"}
 
-        with open(os.path.join(self.test_dir, "test1.json"), "w") as f:
-            json.dump(test_data1, f)
-        with open(os.path.join(self.test_dir, "test2.json"), "w") as f:
-            json.dump(test_data2, f)
-        with open(os.path.join(self.test_dir, "test3.json"), "w") as f:
-            json.dump(test_data3, f)
-
-    def tearDown(self):
-        """Clean up temporary directory"""
-        shutil.rmtree(self.test_dir)
+        # dumps-then-write_text lands each file in a single write,
+        # instead of json.dump's many small chunked writes
+        Path(cls.test_dir, "test1.json").write_text(json.dumps(test_data1))
+        Path(cls.test_dir, "test2.json").write_text(json.dumps(test_data2))
+        Path(cls.test_dir, "test3.json").write_text(json.dumps(test_data3))
 
     def test_combine_json_files(self):
         """Test combining JSON files"""
@@ -58,16 +65,208 @@ class TestJSONCombiner(unittest.TestCase):
         self.assertEqual(result["files_processed"], 3)
         self.assertEqual(result["total_records"], 3)
 
-        # Check output file
+        # Check output file, removing it afterwards so the shared
+        # fixture directory stays pristine for other tests
         output_path = os.path.join(self.test_dir, "combined.json")
+        self.addCleanup(os.remove, output_path)
         self.assertTrue(os.path.exists(output_path))
 
-        with open(output_path, "r") as f:
-            data = json.load(f)
+        data = json.loads(Path(output_path).read_text())
 
         self.assertEqual(len(data), 3)
 
 
+class TestCombinerErrorHandling(unittest.TestCase):
+    """Test cases for the combiner's skip-and-continue error path"""
+
+    def setUp(self):
+        """Create a fresh fixture directory per test"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.test_dir = tmp.name
+
+    def test_corrupt_file_is_skipped(self):
+        """A corrupt input is counted and skipped, not fatal"""
+        Path(self.test_dir, "good1.json").write_text(json.dumps([{"id": 1}]))
+        Path(self.test_dir, "good2.json").write_text(json.dumps([{"id": 2}]))
+        Path(self.test_dir, "broken.json").write_text("{not json")
+
+        result = combine_json_files(
+            input_dir=self.test_dir,
+            output_file="combined.json",
+            quiet=True
+        )
+
+        self.assertEqual(result["files_processed"], 2)
+        self.assertEqual(result["files_skipped"], 1)
+        self.assertEqual(result["total_records"], 2)
+        self.assertEqual(len(result["errors"]), 1)
+
+        data = json.loads(Path(self.test_dir, "combined.json").read_text())
+        self.assertEqual(data, [{"id": 1}, {"id": 2}])
+
+    def test_total_failure_preserves_previous_output(self):
+        """A run where every input fails leaves an older output intact"""
+        Path(self.test_dir, "good.json").write_text(json.dumps([{"id": 1}]))
+        combine_json_files(
+            input_dir=self.test_dir,
+            output_file="combined.json",
+            pattern="good.json",
+            quiet=True
+        )
+        previous = Path(self.test_dir, "combined.json").read_text()
+
+        os.remove(os.path.join(self.test_dir, "good.json"))
+        Path(self.test_dir, "broken.json").write_text("not json")
+
+        with self.assertRaises(JSONCombinerError):
+            combine_json_files(
+                input_dir=self.test_dir,
+                output_file="combined.json",
+                quiet=True
+            )
+
+        self.assertEqual(Path(self.test_dir, "combined.json").read_text(), previous)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "combined.json.tmp")))
+
+    def test_iter_combined_records(self):
+        """The record generator streams all records and reports stats"""
+        Path(self.test_dir, "a.json").write_text(json.dumps([{"id": 1}, {"id": 2}]))
+        Path(self.test_dir, "b.json").write_text(json.dumps({"id": 3}))
+        Path(self.test_dir, "broken.json").write_text("x")
+
+        stats = {}
+        records = list(iter_combined_records(self.test_dir, stats=stats))
+
+        self.assertEqual(records, [{"id": 1}, {"id": 2}, {"id": 3}])
+        self.assertEqual(stats["files_found"], 3)
+        self.assertEqual(stats["files_processed"], 2)
+        self.assertEqual(stats["files_skipped"], 1)
+
+
+class TestStreamingWriter(unittest.TestCase):
+    """Test cases for the incremental JSON array writer"""
+
+    def setUp(self):
+        """Create an output location per test"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output = Path(tmp.name, "out.json")
+
+    def test_compact_roundtrip(self):
+        """Compact streaming output parses back to the input records"""
+        records = [{"id": 1}, {"nested": {"a": [1, 2]}}, {"text": "é"}]
+        count = safe_write_json_stream(iter(records), self.output, indent=0)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(json.loads(self.output.read_text()), records)
+
+    def test_pretty_roundtrip(self):
+        """Indented streaming output is multi-line and parses back"""
+        records = [{"id": 1}, {"id": 2}]
+        count = safe_write_json_stream(iter(records), self.output, indent=4)
+
+        text = self.output.read_text()
+        self.assertEqual(count, 2)
+        self.assertIn("\n", text)
+        self.assertEqual(json.loads(text), records)
+
+    def test_empty_iterable(self):
+        """An empty stream still writes a valid empty array"""
+        count = safe_write_json_stream(iter([]), self.output)
+
+        self.assertEqual(count, 0)
+        self.assertEqual(json.loads(self.output.read_text()), [])
+
+
+class TestFusedPipeline(unittest.TestCase):
+    """Test cases for the fused combine-and-convert pipeline"""
+
+    def setUp(self):
+        """Create a fresh fixture directory per test"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.test_dir = tmp.name
+
+    def _read_rows(self, name):
+        with open(os.path.join(self.test_dir, name), newline="") as f:
+            return list(csv.DictReader(f))
+
+    def test_combine_to_csv(self):
+        """Records from all files land in one CSV, deduplicated by URN"""
+        Path(self.test_dir, "a.json").write_text(json.dumps([
+            {"companyName": "One", "entityUrn": "urn:li:company:1"},
+            {"companyName": "Two", "entityUrn": "urn:li:company:2"},
+        ]))
+        Path(self.test_dir, "b.json").write_text(json.dumps([
+            {"companyName": "One", "entityUrn": "urn:li:company:1"},
+        ]))
+
+        result = combine_to_csv(input_dir=self.test_dir, output_csv="out.csv")
+
+        self.assertEqual(result["files_processed"], 2)
+        self.assertEqual(result["rows_written"], 2)
+        self.assertEqual(result["duplicate_records"], 1)
+
+        rows = self._read_rows("out.csv")
+        self.assertEqual([r["companyName"] for r in rows], ["One", "Two"])
+        self.assertEqual(rows[0]["source_file"], "a.json")
+        self.assertTrue(rows[0]["linkedin_url"].endswith("/1"))
+
+    def test_malformed_record_is_counted(self):
+        """A record that breaks extraction is an error, not a crash"""
+        Path(self.test_dir, "a.json").write_text(json.dumps([
+            {"companyName": "Bad", "entityUrn": "urn:li:company:1",
+             "spotlightBadges": ["not-a-dict"]},
+            {"companyName": "Ok", "entityUrn": "urn:li:company:2"},
+        ]))
+
+        result = combine_to_csv(input_dir=self.test_dir, output_csv="out.csv")
+
+        self.assertEqual(result["rows_written"], 1)
+        self.assertEqual(result["extraction_errors"], 1)
+        self.assertEqual(
+            [r["companyName"] for r in self._read_rows("out.csv")], ["Ok"]
+        )
+
+
+class TestParallelConverter(unittest.TestCase):
+    """Test cases for the enhanced converter's worker-pool path"""
+
+    def test_pool_path_matches_serial(self):
+        """Enough files to trigger the pool: rows and cross-file dedup hold"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        for i in range(5):
+            Path(tmp.name, f"f{i}.json").write_text(json.dumps(
+                [{"companyName": f"Co{i}", "entityUrn": f"urn:li:company:{i}"}]
+            ))
+        Path(tmp.name, "fdup.json").write_text(json.dumps(
+            [{"companyName": "Co0", "entityUrn": "urn:li:company:0"}]
+        ))
+
+        for parallel in ("process", "none"):
+            result = convert_json_to_csv_enhanced(
+                input_dir=tmp.name,
+                output_file=f"out_{parallel}.csv",
+                input_pattern="f*.json",
+                parallel=parallel,
+                quiet=True
+            )
+
+            self.assertEqual(result["rows_written"], 5, parallel)
+            self.assertEqual(result["duplicate_records"], 1, parallel)
+
+            with open(os.path.join(tmp.name, f"out_{parallel}.csv"), newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(
+                [r["companyName"] for r in rows],
+                [f"Co{i}" for i in range(5)],
+                parallel
+            )
+
+
 class TestLinkedInConverters(unittest.TestCase):
     """Test cases for LinkedIn converter utilities"""
 
@@ -10,88 +10,128 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 from pathlib import Path
+from typing import Optional, Union
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from combiners.json_merger import combine_json_files
+from combiners.json_merger import combine_json_files, iter_combined_records
 from converters.linkedin_to_csv_enhanced import convert_json_to_csv as convert_json_to_csv_enhanced
+from utils import setup_logging, log_operation_summary
 
 
-def salesnav_workflow(input_dir: str, output_dir: str = None, keep_combined: bool = False):
+logger = setup_logging("salesnav_workflow")
+
+
+def salesnav_workflow(
+    input_dir: Union[str, Path],
+    output_dir: Optional[Union[str, Path]] = None,
+    keep_combined: bool = False,
+    quiet: bool = False,
+    log_level: str = "INFO"
+):
     """
     Complete workflow for processing LinkedIn Sales Navigator exports.
 
+    Paths are normalized once here and forwarded as Path objects, so
+    the combiner and converter do not re-wrap and re-stat strings.
+    Normalization is lexical (absolute()): nothing downstream needs
+    symlinks chased, and resolve() would stat every path component -
+    noticeable on network mounts and CI overlay filesystems.
+
     Args:
         input_dir: Directory containing JSON export files
         output_dir: Directory for output files (default: same as input_dir)
         keep_combined: Keep the intermediate combined.json file (default: False)
+        quiet: Suppress banners and progress bars; only warnings and
+            errors are emitted (for CI and batch runs)
+        log_level: Logging level name for workflow output (default: INFO)
 
     Returns:
         Dictionary with workflow results
     """
-    input_path = Path(input_dir).resolve()
-    output_path = Path(output_dir).resolve() if output_dir else input_path
+    level = logging.WARNING if quiet else getattr(
+        logging, str(log_level).upper(), logging.INFO
+    )
+    logger.setLevel(level)
+
+    input_path = Path(input_dir).absolute()
+    output_path = Path(output_dir).absolute() if output_dir else input_path
 
     # Create output directory if it doesn't exist
     output_path.mkdir(parents=True, exist_ok=True)
 
-    print("=" * 70)
-    print("LinkedIn Sales Navigator Data Extraction Workflow")
-    print("=" * 70)
-    print(f"\n📂 Input directory: {input_path}")
-    print(f"📁 Output directory: {output_path}\n")
-
-    # Step 1: Combine JSON files
-    print("Step 1: Combining JSON files...")
-    print("-" * 70)
+    # Status goes through the logger rather than a print per line, so a
+    # level filter can silence it and each record is one write
+    logger.info("🚀 LinkedIn Sales Navigator Data Extraction Workflow")
+    logger.info("📂 Input directory: %s", input_path)
+    logger.info("📁 Output directory: %s", output_path)
 
     combined_file = "combined_salesnav.json"
-    combine_result = combine_json_files(
-        input_dir=str(input_path),
-        output_file=combined_file,
-        pattern="*.json"
-    )
-
-    if combine_result["files_processed"] == 0:
-        print("❌ No JSON files found to process!")
-        return {"success": False, "error": "No JSON files found"}
+    csv_file = "linkedin_companies.csv"
 
-    print(f"✅ Combined {combine_result['files_processed']} files")
-    print(f"📊 Total records: {combine_result['total_records']}\n")
+    if keep_combined:
+        # Two-step path: spill the combined JSON to disk since the
+        # caller wants to keep it, then convert from that file
+        logger.info("Step 1/2: Combining JSON files...")
+        combine_result = combine_json_files(
+            input_dir=input_path,
+            output_file=combined_file,
+            pattern="*.json",
+            quiet=quiet
+        )
 
-    # Step 2: Convert to CSV
-    print("Step 2: Converting to CSV...")
-    print("-" * 70)
+        if combine_result["files_processed"] == 0:
+            logger.error("❌ No JSON files found to process!")
+            return {"success": False, "error": "No JSON files found"}
 
-    csv_file = "linkedin_companies.csv"
-    convert_result = convert_json_to_csv_enhanced(
-        input_pattern=combined_file,
-        output_file=str(output_path / csv_file),
-        input_dir=str(input_path)
-    )
+        logger.info("Step 2/2: Converting to CSV...")
+        convert_result = convert_json_to_csv_enhanced(
+            input_pattern=combined_file,
+            output_file=output_path / csv_file,
+            input_dir=input_path,
+            quiet=quiet
+        )
+    else:
+        # Fused path: stream parsed records straight into the CSV
+        # converter, skipping the intermediate file's encode, write,
+        # read and decode entirely
+        logger.info("Streaming JSON records directly to CSV...")
+        combine_stats = {}
+        # Exclude the intermediate file just like the two-step path
+        # does, so a leftover spill from a --keep-combined run is not
+        # re-ingested as input
+        records = iter_combined_records(
+            input_path, pattern="*.json",
+            stats=combine_stats, exclude=combined_file,
+            show_progress=not quiet
+        )
+        convert_result = convert_json_to_csv_enhanced(
+            records=records,
+            output_file=output_path / csv_file,
+            records_source=combined_file,
+            quiet=quiet
+        )
 
-    print(f"✅ CSV created with {convert_result['rows_written']} rows")
-    print(f"📄 Output: {output_path / csv_file}\n")
+        if combine_stats["files_processed"] == 0:
+            logger.error("❌ No JSON files found to process!")
+            return {"success": False, "error": "No JSON files found"}
 
-    # Clean up combined file if requested
-    if not keep_combined:
-        combined_path = input_path / combined_file
-        if combined_path.exists():
-            combined_path.unlink()
-            print(f"🗑️  Removed temporary file: {combined_file}\n")
+        combine_result = {
+            "files_processed": combine_stats["files_processed"],
+            "files_skipped": combine_stats["files_skipped"],
+            "errors": combine_stats["errors"],
+        }
 
     # Summary
-    print("=" * 70)
-    print("✅ Workflow Complete!")
-    print("=" * 70)
-    print(f"📊 Summary:")
-    print(f"   • JSON files processed: {combine_result['files_processed']}")
-    print(f"   • Total companies extracted: {convert_result['rows_written']}")
-    print(f"   • Output CSV: {output_path / csv_file}")
-    print("=" * 70 + "\n")
+    log_operation_summary(logger, "Workflow Complete", {
+        "files_processed": combine_result['files_processed'],
+        "companies_extracted": convert_result['rows_written'],
+        "output_csv": str(output_path / csv_file),
+    })
 
     return {
         "success": True,
@@ -137,20 +177,35 @@ Examples:
         help="Keep the intermediate combined.json file"
     )
 
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Suppress banners and progress output (warnings only)"
+    )
+
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="Logging level for workflow output (default: INFO)"
+    )
+
     args = parser.parse_args()
 
     try:
         result = salesnav_workflow(
             input_dir=args.input_dir,
             output_dir=args.output_dir,
-            keep_combined=args.keep_combined
+            keep_combined=args.keep_combined,
+            quiet=args.quiet,
+            log_level=args.log_level
         )
 
         if not result.get("success"):
             sys.exit(1)
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        logger.error("❌ Error: %s", e)
         sys.exit(1)
 
 